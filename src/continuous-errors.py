@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import argparse
+import random
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from main import (
+    DATA_QUBITS,
+    correct_bit_flips,
+    correct_phase_flips,
+    create_circuit,
+    decode_qubit,
+    encode_qubit,
+    get_backend,
+    inject_continuous_error,
+    measure,
+    measure_x_syndrome,
+    measure_z_syndrome,
+    positive_int,
+)
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import ParameterVector
+
+AXES = ["x", "y", "z"]
+
+
+def build_template(input_state) -> tuple[QuantumCircuit, ParameterVector]:
+    """Build the Shor's code circuit with a parameterised RX, RY and RZ error gate on every data qubit.
+
+    Returns:
+        tuple: The template circuit and its 27 angle parameters, ordered by axis and then by qubit.
+    """
+    from qiskit.circuit import ParameterVector  # noqa: PLC0415
+
+    thetas = ParameterVector("theta", len(AXES) * len(DATA_QUBITS))
+    qc, cr_z, cr_x, result = create_circuit(input_state)
+
+    encode_qubit(qc)
+    inject_continuous_error(qc, {(axis, q): thetas[a * len(DATA_QUBITS) + q] for a, axis in enumerate(AXES) for q in DATA_QUBITS})
+    measure_z_syndrome(qc, cr_z)
+    measure_x_syndrome(qc, cr_x)
+    correct_bit_flips(qc, cr_z)
+    correct_phase_flips(qc, cr_x)
+    decode_qubit(qc)
+    measure(qc, result)
+
+    return qc, thetas
+
+
+def run_sweep(angles, input_state, shots) -> tuple[np.ndarray, np.ndarray]:
+    """Evaluate the whole axis x qubit x angle grid in a single Aer job by binding the template parameters.
+
+    Returns:
+        tuple: Logical fidelity and syndrome detection probability, each with shape (axes, qubits, angles).
+    """
+
+    qc, thetas = build_template(input_state)
+    shape = (len(AXES), len(DATA_QUBITS), len(angles))
+
+    # one row of parameter values per grid point, only the rotated (axis, qubit) pair gets a non-zero angle
+    values = np.zeros((*shape, len(thetas)))
+    for a in range(len(AXES)):
+        for q in DATA_QUBITS:
+            values[a, q, :, a * len(DATA_QUBITS) + q] = angles
+    values = values.reshape(-1, len(thetas))
+    parameter_binds = [{theta: values[:, k].tolist() for k, theta in enumerate(thetas)}]
+
+    # shot branching splits the state at mid-circuit measurements instead of re-simulating every shot
+    job = get_backend("statevector").run(qc, parameter_binds=parameter_binds, shots=shots, shot_branching_enable=True).result()
+
+    fidelity = np.zeros(len(values))
+    detected = np.zeros(len(values))
+    for i in range(len(values)):
+        for key, count in job.get_counts(i).items():
+            logical, *syndromes = key.split()
+            fidelity[i] += count * (logical == str(input_state))
+            detected[i] += count * ("1" in "".join(syndromes))
+    return fidelity.reshape(shape) / shots, detected.reshape(shape) / shots
+
+
+def plot_heatmaps(angles, fidelity, detected) -> None:  # pragma: no cover
+    """Plot logical fidelity and syndrome detection heatmaps over angle and qubit for every rotation axis."""
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
+    fig, axs = plt.subplots(2, len(AXES), figsize=(15, 8), sharex=True, sharey=True)
+    extent = [angles[0], angles[-1], DATA_QUBITS[-1] + 0.5, DATA_QUBITS[0] - 0.5]
+    for a, axis in enumerate(AXES):
+        for row, (data, label) in enumerate([(fidelity, "Logical fidelity"), (detected, "Syndrome detection probability")]):
+            image = axs[row, a].imshow(data[a], aspect="auto", extent=extent, vmin=0, vmax=1, cmap="viridis")
+            axs[row, a].set_title(f"{label}, R{axis.upper()} error")
+            axs[row, a].set_xlabel("Rotation angle (rad)")
+            axs[row, a].set_ylabel("Data qubit")
+            fig.colorbar(image, ax=axs[row, a])
+
+    plt.tight_layout()
+    plt.savefig("continuous_errors_heatmap.png", dpi=300, bbox_inches="tight")
+
+
+def parse_arguments() -> argparse.Namespace:  # pragma: no cover
+    """Parser for command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Shor's code under continuous over-rotation errors",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+
+    parser.add_argument(
+        "--num-angles",
+        type=positive_int,
+        default=13,
+        help="Number of rotation angles between 0 and pi",
+    )
+
+    parser.add_argument(
+        "--shots",
+        type=positive_int,
+        default=1000,
+        help="Number of shots per grid point",
+    )
+
+    parser.add_argument(
+        "--input-state",
+        type=int,
+        choices=[0, 1],
+        help="Initial logical state",
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    args = parse_arguments()
+    input_state = args.input_state if args.input_state is not None else random.randint(0, 1)
+    angles = np.linspace(0, np.pi, args.num_angles)
+
+    fidelity, detected = run_sweep(angles, input_state, args.shots)
+    for a, axis in enumerate(AXES):
+        print(f"R{axis.upper()}: minimum logical fidelity {fidelity[a].min():.3f}")
+    plot_heatmaps(angles, fidelity, detected)
@@ -1,12 +1,15 @@
+from __future__ import annotations
+
 import argparse
 import random
 from collections import Counter
+from functools import cache
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
-from qiskit import ClassicalRegister, QuantumCircuit
-from qiskit_aer import AerSimulator
-
-backend = AerSimulator()
+# matplotlib, Qiskit and Aer are imported where they are first needed so that --help and argument errors stay fast
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+    from qiskit_aer import AerSimulator
 
 DATA_QUBITS = list(range(9))
 BLOCKS = [(0,1,2), (3,4,5), (6,7,8)]
@@ -22,6 +25,7 @@ def create_circuit(input_state) -> QuantumCircuit:
     Returns:
         QuantumCircuit: The initialized quantum circuit.
     """
+    from qiskit import ClassicalRegister, QuantumCircuit  # noqa: PLC0415
 
     qc = QuantumCircuit(17)
 
@@ -93,6 +97,26 @@ def inject_arbitrary_error(qc, error_type, q) -> None:
 
     qc.barrier()
 
+def inject_continuous_error(qc, angles) -> None:
+    """Inject continuous over-rotation errors.
+
+    Args:
+        qc (QuantumCircuit): Circuit to append the error gates to
+        angles (dict): Rotation angle for each (axis, qubit) pair, where axis is "x", "y" or "z".
+            Angles may be Qiskit Parameters so a single template circuit can be bound to many values.
+    """
+
+    # validate every axis first so an invalid key leaves the circuit untouched
+    invalid = [axis for axis, _q in angles if axis not in ("x", "y", "z")]
+    if invalid:
+        msg = f"rotation axis must be x, y or z, got {invalid[0]}"
+        raise ValueError(msg)
+
+    for (axis, q), theta in angles.items():
+        getattr(qc, f"r{axis}")(theta, q)
+
+    qc.barrier()
+
 def measure_z_syndrome(qc, cr_z) -> None:
     """Measure Z-type syndrome for X errors (bit flips)."""
 
@@ -197,10 +221,17 @@ def build_circuit(index, input_state, arbitrary_error, qubit_error) -> QuantumCi
 
     return qc
 
+@cache
+def get_backend(method="automatic") -> AerSimulator:
+    """Create the Aer simulator for a simulation method once and share it between all runs."""
+    from qiskit_aer import AerSimulator  # noqa: PLC0415
+
+    return AerSimulator(method=method)
+
 def run_simulation(qc, shots=1) -> dict:
     """Run the quantum circuit simulation."""
 
-    backend = AerSimulator()
+    backend = get_backend()
     # single shot is enough as there is no randomness in the circuit
     job = backend.run(qc, shots=shots).result()
     return job.get_counts()
@@ -228,6 +259,7 @@ def int_range(min_val, max_val) -> callable:
 
 def plot_histogram(counts) -> None: # pragma: no cover
     """Plot the histogram of measurement results."""
+    import matplotlib.pyplot as plt  # noqa: PLC0415
 
     results = {"0": 0, "1": 0}
     for key, value in counts.items():
@@ -305,6 +337,8 @@ if __name__ == "__main__": # pragma: no cover
 
         # draw circuit if requested
         if args.draw_circuit:
+            import matplotlib.pyplot as plt
+
             fig = qc.draw("mpl", fold=False, cregbundle=False)
             fig.savefig(f"circuit_{s}.png")
             plt.close()
@@ -1,8 +1,18 @@
+from __future__ import annotations
+
 import sys
 import json
 import random
+import numpy as np
 import main as shor_main
 from collections import Counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+# gate set the shared transpilation targets, so every noisy gate is a 1- or 2-qubit gate
+NOISE_BASIS_GATES = ["h", "x", "y", "z", "s", "sdg", "t", "tdg", "cx"]
 
 def add_measurement_noise(counts, p_error):
     # simulate measurement error flipping classical bits with probability p_error
@@ -68,7 +78,122 @@ def compare_methods(num_trials, p_error, n_rounds):
         "multi_round_success_rate": multi_rate,
     }
 
-if __name__ == "__main__":
+def add_circuit_noise(qc, p_gate, p_meas) -> QuantumCircuit:
+    """Copy a circuit with depolarising noise after every 1- and 2-qubit gate and an X flip before every measurement."""
+    from qiskit_aer.noise import depolarizing_error, pauli_error  # noqa: PLC0415
+
+    noisy = qc.copy_empty_like()
+    for instruction in qc.data:
+        operation = instruction.operation
+        if operation.name == "measure" and p_meas > 0:
+            noisy.append(pauli_error([("X", p_meas), ("I", 1 - p_meas)]), instruction.qubits)
+        if getattr(operation, "blocks", None):
+            # conditional corrections are gates too, so noise is added inside if_test blocks
+            operation = operation.replace_blocks([add_circuit_noise(block, p_gate, p_meas) for block in operation.blocks])
+        noisy.append(operation, instruction.qubits, instruction.clbits)
+        if operation.name in NOISE_BASIS_GATES and p_gate > 0:
+            noisy.append(depolarizing_error(p_gate, operation.num_qubits), instruction.qubits)
+    return noisy
+
+
+def build_noise_circuits(input_state, p_values) -> list:
+    """Build one error-free Shor circuit per noise strength, with noise only on the encoding, syndrome and correction steps.
+
+    State preparation, decoding and the final logical measurement stay noise-free, since they act on the unencoded qubit
+    and no code can protect them.
+    """
+    from qiskit import transpile  # noqa: PLC0415
+
+    prepare, cr_z, cr_x, result = shor_main.create_circuit(input_state)
+
+    section = prepare.copy_empty_like()
+    shor_main.encode_qubit(section)
+    shor_main.measure_z_syndrome(section, cr_z)
+    shor_main.measure_x_syndrome(section, cr_x)
+    shor_main.correct_bit_flips(section, cr_z)
+    shor_main.correct_phase_flips(section, cr_x)
+    # transpiled once and shared by every noise strength
+    section = transpile(section, basis_gates=NOISE_BASIS_GATES)
+
+    decode = prepare.copy_empty_like()
+    shor_main.decode_qubit(decode)
+    shor_main.measure(decode, result)
+
+    return [prepare.compose(add_circuit_noise(section, p, p)).compose(decode) for p in p_values]
+
+
+def run_circuit_noise_sweep(p_values, input_state=0, shots=1000) -> np.ndarray:
+    """Logical error rate for every noise strength, simulated in a single batched job."""
+
+    circuits = build_noise_circuits(input_state, p_values)
+    # matrix product state keeps the per-shot cost of the 17 qubit circuit low
+    job = shor_main.get_backend("matrix_product_state").run(circuits, shots=shots).result()
+    logical_error_rates = []
+    for i in range(len(circuits)):
+        counts = job.get_counts(i)
+        failures = sum(count for bitstring, count in counts.items() if bitstring[0] != str(input_state))
+        logical_error_rates.append(failures / shots)
+    return np.array(logical_error_rates)
+
+
+def estimate_pseudo_threshold(p_values, logical_error_rates) -> float | None:
+    """Physical error rate where the logical error rate rises above the p_L = p baseline, linearly interpolated.
+
+    The baseline is an unencoded qubit whose error probability equals the depolarising parameter p given to depolarizing_error(p).
+    Returns None when there is no crossing on the grid, e.g. when p_L > p already at the smallest p.
+    Points without any logical failure are skipped, since they only bound p_L by the number of shots.
+    """
+
+    resolved = np.asarray(logical_error_rates) > 0
+    p_values = np.asarray(p_values)[resolved]
+    difference = np.asarray(logical_error_rates)[resolved] - p_values
+    for i in range(len(difference) - 1):
+        if difference[i] < 0 <= difference[i + 1]:
+            fraction = -difference[i] / (difference[i + 1] - difference[i])
+            return float(p_values[i] + fraction * (p_values[i + 1] - p_values[i]))
+    return None
+
+
+def compare_circuit_noise(p_max, num_points, shots) -> dict:
+    """Logical vs physical error rate curve and pseudo-threshold for circuit-level depolarising noise."""
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
+    p_values = np.geomspace(p_max / 100, p_max, num_points)
+    input_state = random.randint(0, 1)
+    logical_error_rates = run_circuit_noise_sweep(p_values, input_state, shots=shots)
+    threshold = estimate_pseudo_threshold(p_values, logical_error_rates)
+    for p, p_logical in zip(p_values, logical_error_rates):
+        print(f"p={p:.4f} -> p_L={p_logical:.4f}")
+    if threshold is None:
+        print(f"No pseudo-threshold crossing on this grid (p_L/p = {logical_error_rates[0] / p_values[0]:.2f} at the smallest p)")
+    else:
+        print(f"Pseudo-threshold: {threshold:.4f}")
+
+    plt.loglog(p_values, logical_error_rates, "bs-", label="Shor code (logical)", linewidth=2, markersize=6)
+    plt.loglog(p_values, p_values, "k--", label="Unencoded qubit (p_L = p)")
+    if threshold is not None:
+        plt.axvline(threshold, color="r", linestyle=":", label=f"Pseudo-threshold {threshold:.4f}")
+    plt.xlabel("Physical error rate p")
+    plt.ylabel("Logical error rate")
+    plt.title("Circuit-level depolarising noise")
+    plt.grid(visible=True, which="both", alpha=0.3)
+    plt.legend()
+    plt.savefig("circuit_noise_threshold.png", dpi=300, bbox_inches="tight")
+
+    return {
+        "shots": shots,
+        "physical_error_rates": p_values.tolist(),
+        "logical_error_rates": logical_error_rates.tolist(),
+        "pseudo_threshold": threshold,
+    }
+
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "circuit":
+    p_max = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    num_points = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    shots = int(sys.argv[4]) if len(sys.argv) > 4 else 500
+    results = compare_circuit_noise(p_max, num_points, shots)
+    print(json.dumps(results))
+elif __name__ == "__main__":
     num_trials = int(sys.argv[1]) if len(sys.argv) > 1 else 200
     p_error = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
     n_rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 3
@@ -0,0 +1,251 @@
+"""Exhaustive Pauli propagation through the Shor code circuit of main.py using binary symplectic maps.
+
+Every Pauli error on the 9 data qubits is stored as a row of a binary matrix (x bits of the 17 qubits followed by their z bits),
+so all 4^9 errors are pushed through the syndrome extraction, correction and decoding steps at once with NumPy array operations.
+The gate sequences and corrections are read once from the circuits that the functions of main.py build, so the two cannot drift apart.
+"""
+
+from functools import cache
+
+import numpy as np
+
+from main import (
+    ANCILLAS_X,
+    ANCILLAS_Z,
+    DATA_QUBITS,
+    correct_bit_flips,
+    correct_phase_flips,
+    create_circuit,
+    decode_qubit,
+    encode_qubit,
+    measure_x_syndrome,
+    measure_z_syndrome,
+)
+
+NUM_DATA_QUBITS = len(DATA_QUBITS)
+NUM_QUBITS = NUM_DATA_QUBITS + 2 * len(ANCILLAS_Z) + len(ANCILLAS_X)
+NUM_ERRORS = 4**NUM_DATA_QUBITS
+CORRECTION_GATES = {"x": 0, "z": NUM_QUBITS}
+
+
+def step_circuit(step) -> tuple:
+    """Circuit built by a single step of main.py on top of create_circuit(), with the register the step reads or writes."""
+
+    qc, cr_z, cr_x, _result = create_circuit(0)
+    registers = {measure_z_syndrome: cr_z, correct_bit_flips: cr_z, measure_x_syndrome: cr_x, correct_phase_flips: cr_x}
+    if step in registers:
+        step(qc, registers[step])
+    else:
+        step(qc)
+    return qc
+
+
+def qubit_indices(qc, bits) -> tuple:
+    """Return the indices of qubits or clbits within a circuit."""
+
+    return tuple(qc.find_bit(bit).index for bit in bits)
+
+
+@cache
+def step_gates(step) -> tuple:
+    """Gates appended by a step of main.py as (name, *qubits) tuples, without barriers and measurements."""
+
+    qc = step_circuit(step)
+    return tuple(
+        (instruction.operation.name, *qubit_indices(qc, instruction.qubits))
+        for instruction in qc.data
+        if instruction.operation.name not in ("barrier", "measure")
+    )
+
+
+@cache
+def step_measurements(step) -> tuple:
+    """(qubit, clbit) pairs measured by a step of main.py."""
+
+    qc = step_circuit(step)
+    return tuple(
+        (*qubit_indices(qc, instruction.qubits), *qubit_indices(qc, instruction.clbits))
+        for instruction in qc.data
+        if instruction.operation.name == "measure"
+    )
+
+
+@cache
+def step_corrections(step) -> tuple:
+    """Conditional corrections of a step of main.py as (clbits, register value, gate, qubit) tuples."""
+
+    qc = step_circuit(step)
+    corrections = []
+    for instruction in qc.data:
+        if instruction.operation.name != "if_else":
+            continue
+        register, value = instruction.operation.condition
+        corrections.extend((qubit_indices(qc, register), value, gate.operation.name, *qubit_indices(qc, gate.qubits)) for gate in instruction.operation.blocks[0].data)
+    return tuple(corrections)
+
+
+def encode_gates() -> tuple:
+    """Gate sequence of encode_qubit()."""
+
+    return step_gates(encode_qubit)
+
+
+def syndrome_gates() -> tuple:
+    """Gate sequence of measure_z_syndrome() followed by measure_x_syndrome(), without the measurements."""
+
+    return step_gates(measure_z_syndrome) + step_gates(measure_x_syndrome)
+
+
+def decode_gates() -> tuple:
+    """Gate sequence of decode_qubit()."""
+
+    return step_gates(decode_qubit)
+
+
+def gate_map(gate) -> np.ndarray:
+    """Binary symplectic matrix of a single Clifford gate acting on row vectors (x | z).
+
+    Args:
+        gate (tuple): ("h", q) or ("cx", control, target)
+
+    Returns:
+        np.ndarray: 34x34 matrix M such that a Pauli frame v is mapped to v @ M (mod 2).
+    """
+
+    matrix = np.eye(2 * NUM_QUBITS, dtype=np.uint8)
+    if gate[0] == "h":
+        q = gate[1]
+        matrix[[q, NUM_QUBITS + q]] = matrix[[NUM_QUBITS + q, q]]
+    elif gate[0] == "cx":
+        c, t = gate[1], gate[2]
+        # X on the control spreads to the target, Z on the target spreads back to the control
+        matrix[c, t] = 1
+        matrix[NUM_QUBITS + t, NUM_QUBITS + c] = 1
+    else:
+        msg = f"{gate[0]} is not a Clifford gate supported by gate_map"
+        raise ValueError(msg)
+    return matrix
+
+
+def circuit_map(gates) -> np.ndarray:
+    """Compose the symplectic matrices of a sequence of Clifford gates."""
+
+    matrix = np.eye(2 * NUM_QUBITS, dtype=np.uint8)
+    for gate in gates:
+        matrix = (matrix.astype(np.int64) @ gate_map(gate)) % 2
+    return matrix.astype(np.uint8)
+
+
+def apply_map(frames, matrix) -> np.ndarray:
+    """Apply a symplectic matrix to every Pauli frame (row) at once."""
+
+    # the maps are sparse, so v @ M is evaluated as XORs of the frame columns selected by the nonzero entries of M
+    mapped = np.zeros_like(frames)
+    for i, j in zip(*np.nonzero(matrix)):
+        mapped[:, j] ^= frames[:, i]
+    return mapped
+
+
+def apply_gates(frames, gates) -> np.ndarray:
+    """Propagate Pauli frames through a gate sequence that may contain Toffoli gates.
+
+    Runs of Clifford gates are folded into a single symplectic map. A ccx is applied as a classically controlled X,
+    which is exact here because its controls hold computational basis states in the error-free circuit.
+    """
+
+    frames = frames.copy(order="F")
+    clifford_run = []
+    for gate in [*gates, None]:
+        if gate is not None and gate[0] != "ccx":
+            clifford_run.append(gate)
+            continue
+        if clifford_run:
+            frames = apply_map(frames, circuit_map(clifford_run))
+            clifford_run = []
+        if gate is not None:
+            c1, c2, t = gate[1], gate[2], gate[3]
+            frames[:, t] ^= frames[:, c1] & frames[:, c2]
+    return frames
+
+
+def stabilizer_generators() -> np.ndarray:
+    """Stabilizer generators of the code on the data qubits, obtained by pushing Z1..Z8 through the encoder."""
+
+    encoder = circuit_map(encode_gates())
+    rows = encoder[[NUM_QUBITS + q for q in range(1, NUM_DATA_QUBITS)]]
+    return np.concatenate([rows[:, :NUM_DATA_QUBITS], rows[:, NUM_QUBITS:NUM_QUBITS + NUM_DATA_QUBITS]], axis=1)
+
+
+def error_index(*errors: tuple) -> int:
+    """Index of the data-qubit Pauli error given as (error_type, qubit) pairs such as ("x", 0), ("z", 4).
+
+    Bit q of the index is the X component on qubit q, bit 9 + q the Z component. Products are taken up to a global phase.
+    """
+
+    index = 0
+    for error_type, q in errors:
+        if error_type in ("x", "y"):
+            index ^= 1 << q
+        if error_type in ("z", "y"):
+            index ^= 1 << (NUM_DATA_QUBITS + q)
+    return index
+
+
+def error_frames(indices) -> np.ndarray:
+    """Pauli frames on all 17 qubits for the given data-qubit error indices."""
+
+    indices = np.asarray(indices, dtype=np.int64)
+    # column-major so that every qubit component is a contiguous array
+    frames = np.zeros((len(indices), 2 * NUM_QUBITS), dtype=np.uint8, order="F")
+    for q in DATA_QUBITS:
+        frames[:, q] = (indices >> q) & 1
+        frames[:, NUM_QUBITS + q] = (indices >> (NUM_DATA_QUBITS + q)) & 1
+    return frames
+
+
+def correct(frames, syndromes) -> np.ndarray:
+    """Apply the syndrome-conditioned corrections of correct_bit_flips() and correct_phase_flips() to every frame."""
+
+    frames = frames.copy(order="F")
+    # syndrome columns are ordered by clbit, so a register's clbits index straight into them
+    for clbits, value, gate, q in step_corrections(correct_bit_flips) + step_corrections(correct_phase_flips):
+        register_value = sum(syndromes[:, clbit].astype(np.int64) << k for k, clbit in enumerate(clbits))
+        frames[:, CORRECTION_GATES[gate] + q] ^= (register_value == value)
+    return frames
+
+
+def propagate(indices) -> tuple:
+    """Push data-qubit Pauli errors injected after encoding through syndrome measurement, correction and decoding.
+
+    Args:
+        indices (array-like): Error indices as produced by error_index()
+
+    Returns:
+        tuple: (syndromes, failures) where syndromes has one row of 8 bits per error in the order
+        cr_z0[0], cr_z0[1], cr_z1[0], cr_z1[1], cr_z2[0], cr_z2[1], cr_x[0], cr_x[1],
+        and failures is True where the measured logical bit differs from the input state.
+    """
+
+    frames = apply_gates(error_frames(indices), syndrome_gates())
+    # ancillas are measured in the Z basis, so their outcome flips with the X component of the frame
+    measurements = sorted(step_measurements(measure_z_syndrome) + step_measurements(measure_x_syndrome), key=lambda pair: pair[1])
+    syndromes = frames[:, [q for q, _clbit in measurements]]
+
+    frames = correct(frames, syndromes)
+    frames = apply_gates(frames, decode_gates())
+    failures = frames[:, 0].astype(bool)
+    return syndromes, failures
+
+
+def propagate_all() -> tuple:
+    """Syndrome table and logical failure indicator for all 4^9 Pauli errors on the data qubits."""
+
+    return propagate(np.arange(NUM_ERRORS))
+
+
+def counts_key(syndrome, input_state, failure) -> str:
+    """Format a syndrome row and failure flag like the keys of the Aer counts returned by run_simulation()."""
+
+    registers = [syndrome[2 * i:2 * i + 2] for i in range(4)]
+    bits = ["".join(str(int(b)) for b in reversed(register)) for register in reversed(registers)]
+    return " ".join([str(int(input_state) ^ int(failure)), *bits])
@@ -1,31 +1,16 @@
-import json
-import subprocess
 import numpy as np
-import matplotlib.pyplot as plt
+import main_noisy
 
 num_trials = 500
 
 def run_experiment(num_trials, p_error, n_rounds):
-    # execute main_noisy.py with given parameters
-    cmd = ['python', 'main_noisy.py', str(num_trials), str(p_error), str(n_rounds)]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"Error running: {' '.join(cmd)}")
-        print(result.stderr)
-        return None
-    
-    # parse JSON from last line of output
-    lines = result.stdout.strip().split('\n')
-    if not lines:
-        return None
-    
+    # run main_noisy comparison in-process, so Qiskit and the simulator backend are loaded once for the whole sweep
     # returns dict with success rates or None on error.
     try:
-        results = json.loads(lines[-1])
-        return results
-    except json.JSONDecodeError:
-        print("Failed to parse JSON output")
-        print("Last 200 chars:", result.stdout[-200:])
+        return main_noisy.compare_methods(num_trials, p_error, n_rounds)
+    except Exception as error:
+        print(f"Error running: main_noisy.compare_methods({num_trials}, {p_error}, {n_rounds})")
+        print(error)
         return None
 
 def sweep_measurement_error():
@@ -69,6 +54,8 @@ def sweep_num_rounds():
     return n_rounds_list, np.array(single_rates), np.array(multi_rates)
 
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
     # create side-by-side plots
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
     
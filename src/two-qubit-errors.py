@@ -1,8 +1,14 @@
+from __future__ import annotations
+
 import random
 from collections import Counter
-from qiskit import QuantumCircuit
+from typing import TYPE_CHECKING
+from pauli_propagation import counts_key, error_index, propagate_all
 from main import create_circuit, encode_qubit, measure_z_syndrome, measure_x_syndrome, correct_bit_flips, correct_phase_flips, decode_qubit, measure, plot_histogram, run_simulation
 
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
 
 def inject_error_sequentially(qc, index) -> None:
     """Inject first error sequentially."""
@@ -64,12 +70,20 @@ if __name__ == "__main__":
     total_counts = Counter()
 
     input_state = random.randint(0, 1)
+    # exhaustive Pauli propagation oracle to cross-check every Aer result against
+    syndromes, failures = propagate_all()
 
     for s in range(27 * 27):
         qc = build_circuit(s, input_state)
         counts = run_simulation(qc, shots=1)
         total_counts.update(counts)
 
+        (p1, q1), (p2, q2) = decode_error_index(s)
+        error = error_index((p1.lower(), q1), (p2.lower(), q2))
+        expected = counts_key(syndromes[error], input_state, failures[error])
+        if list(counts.keys()) != [expected]:
+            print(f"{p1}{q1} {p2}{q2}: Aer {list(counts.keys())} does not match Pauli propagation {expected}")
+
         meas = next(iter(counts))[0]
         if meas != str(input_state):
             correctness = False
@@ -1,8 +1,13 @@
+from __future__ import annotations
+
 import random
 from collections import Counter
-from qiskit import QuantumCircuit
+from typing import TYPE_CHECKING
 from main import create_circuit, encode_qubit, measure_z_syndrome, measure_x_syndrome, decode_qubit, measure, run_simulation, plot_histogram, inject_arbitrary_error
 
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
 
 def build_circuit(index, input_state) -> QuantumCircuit:
     """Build the quantum circuit for the Shor's code."""
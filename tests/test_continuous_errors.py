@@ -0,0 +1,29 @@
+import importlib
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# continuous-errors.py is a script that imports main as a top-level module
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+ce = importlib.import_module("continuous-errors")
+
+# build_template()
+def test_build_template():
+    qc, thetas = ce.build_template(0)
+    assert len(thetas) == 27
+    assert qc.num_parameters == 27
+    assert qc.count_ops().get("rx", 0) == 9
+    assert qc.count_ops().get("ry", 0) == 9
+    assert qc.count_ops().get("rz", 0) == 9
+
+# run_sweep()
+def test_run_sweep():
+    angles = np.array([0, np.pi])
+    fidelity, detected = ce.run_sweep(angles, 1, shots=8)
+    assert fidelity.shape == (3, 9, 2)
+    assert detected.shape == (3, 9, 2)
+    # a rotation by pi is a full Pauli flip, which is always detected and corrected
+    assert np.all(detected[:, :, 0] == 0)
+    assert np.all(detected[:, :, 1] == 1)
+    assert np.all(fidelity == 1)
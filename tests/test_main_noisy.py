@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+# main_noisy.py is a script that imports main as a top-level module
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import main_noisy as mn  # noqa: E402
+
+def create_test_circuit():
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure(0, 0)
+    with qc.if_test((qc.clbits[0], 1)):
+        qc.x(1)
+    qc.measure(1, 1)
+    return qc
+
+def count_channels(qc):
+    count = 0
+    for instruction in qc.data:
+        if instruction.operation.name == "quantum_channel":
+            count += 1
+        for block in getattr(instruction.operation, "blocks", ()):
+            count += count_channels(block)
+    return count
+
+# add_circuit_noise()
+def test_add_circuit_noise():
+    noisy = mn.add_circuit_noise(create_test_circuit(), 0.1, 0.1)
+    # h, cx and two measurements at the top level, x inside the if_else block
+    assert count_channels(noisy) == 5
+    if_else = next(instruction.operation for instruction in noisy.data if instruction.operation.name == "if_else")
+    assert count_channels(if_else.blocks[0]) == 1
+
+def test_add_circuit_noise_zero():
+    qc = create_test_circuit()
+    noisy = mn.add_circuit_noise(qc, 0, 0)
+    assert count_channels(noisy) == 0
+    assert noisy.count_ops() == qc.count_ops()
+
+# estimate_pseudo_threshold()
+def test_estimate_pseudo_threshold_crossing():
+    p_values = np.array([0.01, 0.1, 0.2])
+    logical_error_rates = np.array([0.001, 0.05, 0.3])
+    # p_L - p goes from -0.05 to +0.1 between 0.1 and 0.2
+    assert np.isclose(mn.estimate_pseudo_threshold(p_values, logical_error_rates), 0.1 + 0.1 / 3)
+
+def test_estimate_pseudo_threshold_none():
+    p_values = np.array([0.01, 0.1, 0.2])
+    assert mn.estimate_pseudo_threshold(p_values, 3 * p_values) is None
+    assert mn.estimate_pseudo_threshold(p_values, p_values / 2) is None
+    # a point without failures is not resolved by the shots, so it cannot start a crossing
+    assert mn.estimate_pseudo_threshold(p_values, np.array([0, 0.3, 0.6])) is None
+
+# build_noise_circuits()
+def test_build_noise_circuits_error_free():
+    circuits = mn.build_noise_circuits(1, [0, 0.1])
+    assert len(circuits) == 2
+    assert count_channels(circuits[0]) == 0
+    assert count_channels(circuits[1]) > 0
+    # no error is injected, so the noiseless circuit decodes the input state
+    counts = mn.shor_main.run_simulation(circuits[0], shots=5)
+    assert [key[0] for key in counts] == ["1"]
+    # decoding and the final measurement stay noise-free
+    assert circuits[1].data[-1].operation.name == "measure"
+    assert circuits[1].data[-2].operation.name != "quantum_channel"
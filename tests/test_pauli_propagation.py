@@ -0,0 +1,109 @@
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import src.main as sc
+
+# pauli_propagation.py imports main as a top-level module, like the scripts in src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import pauli_propagation as pp  # noqa: E402
+
+SEQUENTIAL_ERRORS = [("x", q) for q in range(9)] + [("z", q) for q in range(9)] + [("y", q) for q in range(9)]
+
+@pytest.fixture(scope="module")
+def table():
+    return pp.propagate_all()
+
+# gate_map()
+def test_gate_map_is_symplectic():
+    omega = np.block([[np.zeros((17, 17)), np.eye(17)], [np.eye(17), np.zeros((17, 17))]])
+    for gate in [("h", 3), ("cx", 0, 9)]:
+        matrix = pp.gate_map(gate).astype(int)
+        assert np.array_equal((matrix @ omega @ matrix.T) % 2, omega)
+
+def test_gate_map_invalid():
+    with pytest.raises(ValueError):
+        pp.gate_map(("ccx", 0, 1, 2))
+
+# stabilizer_generators()
+def test_stabilizer_generators():
+    stabilizers = pp.stabilizer_generators()
+    assert stabilizers.shape == (8, 18)
+    # Z0Z1 and X0..X5 are among the generators of the Shor code
+    assert stabilizers[0, 9:11].tolist() == [1, 1]
+    assert stabilizers[2, :6].tolist() == [1] * 6
+
+# step_gates()
+def test_gate_sequences_follow_main():
+    qc, _cr_z, _cr_x, _result = sc.create_circuit(0)
+    sc.decode_qubit(qc)
+    assert len(pp.decode_gates()) == len(qc.data)
+    assert pp.encode_gates()[:2] == (("cx", 0, 3), ("cx", 0, 6))
+    assert sum(gate[0] == "ccx" for gate in pp.decode_gates()) == 4
+
+# step_corrections()
+def test_step_corrections():
+    corrections = pp.step_corrections(pp.correct_phase_flips)
+    assert [(value, gate, q) for _clbits, value, gate, q in corrections] == [(0b01, "z", 0), (0b11, "z", 3), (0b10, "z", 6)]
+    assert corrections[0][0] == (6, 7)
+
+# error_index()
+def test_error_index():
+    assert pp.error_index(("x", 0)) == 1
+    assert pp.error_index(("z", 0)) == 1 << 9
+    assert pp.error_index(("y", 2)) == pp.error_index(("x", 2), ("z", 2))
+    assert pp.error_index(("x", 4), ("x", 4)) == 0
+
+# propagate_all()
+def test_propagate_all_shape(table):
+    syndromes, failures = table
+    assert syndromes.shape == (4**9, 8)
+    assert failures.shape == (4**9,)
+    assert not failures[0]
+    assert not syndromes[0].any()
+
+def test_single_errors_corrected(table):
+    _syndromes, failures = table
+    for error in SEQUENTIAL_ERRORS:
+        assert not failures[pp.error_index(error)]
+
+def test_stabilizers_are_harmless(table):
+    syndromes, failures = table
+    for row in pp.stabilizer_generators():
+        index = int(sum(int(bit) << i for i, bit in enumerate(row)))
+        assert not failures[index]
+        assert not syndromes[index].any()
+
+def test_logical_operator_fails(table):
+    _syndromes, failures = table
+    # Z on one qubit of every block flips the logical bit without triggering a syndrome
+    assert failures[pp.error_index(("z", 0), ("z", 3), ("z", 6))]
+
+# cross-check against Aer
+@pytest.mark.parametrize("index", range(27))
+def test_matches_aer_single_errors(table, index):
+    syndromes, failures = table
+    input_state = index % 2
+    counts = sc.run_simulation(sc.build_circuit(index, input_state, None, None))
+    error = pp.error_index(SEQUENTIAL_ERRORS[index])
+    assert list(counts) == [pp.counts_key(syndromes[error], input_state, failures[error])]
+
+@pytest.mark.parametrize("errors", list(itertools.combinations([("x", 1), ("z", 4), ("y", 8), ("x", 2)], 2)))
+def test_matches_aer_two_errors(table, errors):
+    syndromes, failures = table
+    qc, cr_z, cr_x, result = sc.create_circuit(1)
+    sc.encode_qubit(qc)
+    for error_type, q in errors:
+        sc.inject_arbitrary_error(qc, error_type, q)
+    sc.measure_z_syndrome(qc, cr_z)
+    sc.measure_x_syndrome(qc, cr_x)
+    sc.correct_bit_flips(qc, cr_z)
+    sc.correct_phase_flips(qc, cr_x)
+    sc.decode_qubit(qc)
+    sc.measure(qc, result)
+    counts = sc.run_simulation(qc)
+    error = pp.error_index(*errors)
+    assert list(counts) == [pp.counts_key(syndromes[error], 1, failures[error])]
@@ -44,6 +44,20 @@ def test_inject_arbitrary_error():
     sc.inject_arbitrary_error(qc, "y", 2)
     assert qc.count_ops().get("x", 0) == 1
 
+# inject_continuous_error()
+def test_inject_continuous_error():
+    qc, _cr_z, _cr_x, _result = create_test_circuit()
+    sc.inject_continuous_error(qc, {("x", 0): 0.1, ("y", 1): 0.2, ("z", 2): 0.3})
+    assert qc.count_ops().get("rx", 0) == 1
+    assert qc.count_ops().get("ry", 0) == 1
+    assert qc.count_ops().get("rz", 0) == 1
+
+def test_inject_continuous_error_invalid():
+    qc, _cr_z, _cr_x, _result = create_test_circuit()
+    with pytest.raises(ValueError):
+        sc.inject_continuous_error(qc, {("x", 0): 0.1, ("w", 1): 0.1})
+    assert len(qc.data) == 0
+
 # measure_z_syndrome()
 def test_measure_z_syndrome():
     qc, cr_z, _cr_x, _result = create_test_circuit()
@@ -98,6 +112,11 @@ def test_build_circuit_2():
     assert isinstance(counts, dict)
     assert len(counts) >= 1
 
+# get_backend()
+def test_get_backend_is_shared():
+    assert sc.get_backend() is sc.get_backend()
+    assert sc.get_backend("matrix_product_state") is not sc.get_backend()
+
 # positive_int()
 def test_positive_int_valid():
     assert sc.positive_int("1") == 1
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+ENTRY_POINTS = ["main", "main_noisy", "plot_comparison", "two-qubit-errors", "z-errors", "continuous-errors", "pauli_propagation"]
+HEAVY_MODULES = ("qiskit", "qiskit_aer", "matplotlib")
+# importing an entry point used to take close to a second; NumPy is left out of the budget as its import time varies a lot between machines
+IMPORT_TIME_BUDGET_US = 250_000
+
+def import_times(module):
+    # cumulative import time in microseconds for every module loaded, as reported by python -X importtime
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"__import__('{module}')"],
+        cwd=SRC, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_entry_point_skips_heavy_imports(module):
+    times = import_times(module)
+    loaded = [name for name in times if name.split(".")[0] in HEAVY_MODULES]
+    assert loaded == []
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_entry_point_import_time(module):
+    times = import_times(module)
+    assert times[module] - times.get("numpy", 0) < IMPORT_TIME_BUDGET_US
+
+def test_help_runs():
+    result = subprocess.run([sys.executable, "main.py", "--help"], cwd=SRC, capture_output=True, text=True, check=True)
+    assert "--num-simulations" in result.stdout